@@ -16,28 +16,46 @@ This file is the main entry point of the project. Run it with:
     python run_app.py
 """
 
+import atexit
 import csv
+import functools
+import heapq
 import os
+import queue
+import re
+import threading
 from datetime import datetime, date, time, timedelta
+from typing import NamedTuple, TextIO
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-try:
-    import matplotlib
-    matplotlib.use("TkAgg")
-    from matplotlib.figure import Figure
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    MATPLOTLIB_OK = True
-except Exception:
-    # App still works, but the Summary chart will be disabled.
-    MATPLOTLIB_OK = False
-
-try:
-    import pandas as pd
-    PANDAS_OK = True
-except Exception:
-    # SnoozeManager falls back to pure csv logic if pandas is not available.
-    PANDAS_OK = False
+# Matplotlib is only needed by the Summary tab and costs hundreds of ms
+# (and tens of MB) to import, so it is loaded lazily on first use.
+# MATPLOTLIB_OK is None until the import has been attempted.
+MATPLOTLIB_OK: bool | None = None
+_MPL: tuple | None = None  # (Figure, FigureCanvasTkAgg) once imported.
+
+
+def _load_matplotlib() -> bool:
+    """Import matplotlib on first use.
+
+    Returns:
+        True if matplotlib is available; False otherwise (the Summary
+        chart falls back to a plain Tk canvas).
+    """
+    global MATPLOTLIB_OK, _MPL
+    if MATPLOTLIB_OK is None:
+        try:
+            import matplotlib
+            matplotlib.use("TkAgg")
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            _MPL = (Figure, FigureCanvasTkAgg)
+            MATPLOTLIB_OK = True
+        except Exception:
+            # App still works, but the chart uses the Tk canvas fallback.
+            MATPLOTLIB_OK = False
+    return MATPLOTLIB_OK
 
 # ---------------- Files / headers ----------------
 SCHEDULE_CSV = "med_schedule.csv"
@@ -48,9 +66,20 @@ SCHEDULE_HEADERS = ["med_id", "med_name", "dose", "times_csv", "days_mask", "act
 LOG_HEADERS = ["log_id", "med_id", "scheduled_dt", "action", "actual_dt"]
 SNOOZE_HEADERS = ["med_id", "scheduled_dt", "new_dt"]
 
+ACTIONS = ("taken", "snoozed", "skipped")
+
 DAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 DATE_FMT = "%Y-%m-%d %H:%M"
 
+# Shape of a DATE_FMT timestamp. Hot loops check this before calling
+# _parse_dt so garbage rows never raise; a cheap match beats the cost of
+# raising and catching ValueError per bad row. Shape-valid strings with
+# out-of-range fields (hour 99) still need a narrow ValueError guard.
+_DT_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}")
+
+# Values (lowercased) that count as an active medication flag.
+_ACTIVE_TRUE = frozenset(("1", "true", "yes"))
+
 # Grid buckets by hour (simple grouping for weekly view)
 BUCKETS = {
     "AM": range(5, 12),
@@ -59,6 +88,12 @@ BUCKETS = {
     "Bed": list(range(20, 24)) + list(range(0, 5)),
 }
 
+# Flattened hour -> bucket label table so lookups need no range scans.
+_HOUR_TO_BUCKET = tuple(
+    next((label for label, hours in BUCKETS.items() if h in hours), "AM")
+    for h in range(24)
+)
+
 
 # ---------------- CSV helpers ----------------
 def ensure_csv(path: str, headers: list[str]) -> None:
@@ -68,14 +103,27 @@ def ensure_csv(path: str, headers: list[str]) -> None:
         path: File path of the CSV file.
         headers: List of header strings to write as first row.
     """
-    if not os.path.exists(path):
-        with open(path, "w", newline="", encoding="utf-8") as f:
+    try:
+        # Exclusive create: one syscall covers the exists check and the open.
+        with open(path, "x", newline="", encoding="utf-8") as f:
             csv.writer(f).writerow(headers)
+    except FileExistsError:
+        pass
+
+
+# Cache of parsed CSV files: path -> ((mtime_ns, size), rows).
+# The scheduler re-reads the same files every tick, so when the stat info
+# is unchanged we can skip re-parsing entirely (one stat syscall instead).
+_CSV_CACHE: dict[str, tuple[tuple[int, int], list[dict]]] = {}
 
 
 def read_rows(path: str) -> list[dict]:
     """Read all rows from a CSV file as a list of dicts.
 
+    Results are cached per path and only re-parsed when os.stat shows the
+    file changed (mtime or size). Callers must not mutate the returned list
+    unless they write it back via write_all.
+
     Args:
         path: File path of the CSV file.
 
@@ -83,10 +131,68 @@ def read_rows(path: str) -> list[dict]:
         List of rows; each row is a dict mapping column name to value.
         Returns an empty list if the file does not exist.
     """
-    if not os.path.exists(path):
+    try:
+        st = os.stat(path)
+    except OSError:
         return []
-    with open(path, "r", newline="", encoding="utf-8") as f:
-        return list(csv.DictReader(f))
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _CSV_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with open(path, "r", newline="", encoding="utf-8", buffering=1 << 16) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            rows = []
+        else:
+            # Plain reader + zip skips DictReader's per-row bookkeeping,
+            # which is the hottest allocator once the log grows.
+            rows = [dict(zip(header, values)) for values in reader]
+    _CSV_CACHE[path] = (key, rows)
+    return rows
+
+
+# Long-lived append handles: path -> (file object, DictWriter). Re-opening
+# the file (plus the exists/getsize checks) on every log event is pure
+# syscall overhead, so each CSV gets one writer kept open for the session.
+_WRITERS: dict[str, tuple[TextIO, csv.DictWriter]] = {}
+
+
+def _get_writer(path: str, headers: list[str]) -> tuple[TextIO, csv.DictWriter]:
+    """Return (and cache) an open append-mode writer for the given CSV.
+
+    Writes the header row if the file is empty or newly created.
+
+    Args:
+        path: File path of the CSV file.
+        headers: Column headers for the file.
+    """
+    entry = _WRITERS.get(path)
+    if entry is None:
+        f = open(path, "a", newline="", encoding="utf-8", buffering=1 << 16)
+        w = csv.DictWriter(f, fieldnames=headers)
+        if f.tell() == 0:
+            w.writeheader()
+        entry = (f, w)
+        _WRITERS[path] = entry
+    return entry
+
+
+def _close_writer(path: str) -> None:
+    """Close and drop the cached writer for a path, if any."""
+    entry = _WRITERS.pop(path, None)
+    if entry is not None:
+        try:
+            entry[0].close()
+        except Exception:
+            pass
+
+
+@atexit.register
+def _close_all_writers() -> None:
+    """Flush and close every cached writer at interpreter exit."""
+    for path in list(_WRITERS):
+        _close_writer(path)
 
 
 def append_row(path: str, headers: list[str], row: dict) -> None:
@@ -97,13 +203,15 @@ def append_row(path: str, headers: list[str], row: dict) -> None:
         headers: Column headers for the file.
         row: Mapping of column name to value.
     """
-    ensure_csv(path, headers)
-    file_exists = os.path.exists(path) and os.path.getsize(path) > 0
-    with open(path, "a", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=headers)
-        if not file_exists:
-            w.writeheader()
-        w.writerow(row)
+    f, w = _get_writer(path, headers)
+    w.writerow(row)
+    f.flush()  # Keep crash safety: one buffered write + flush per event.
+    # Keep the cache in sync instead of forcing a full re-parse next read.
+    cached = _CSV_CACHE.get(path)
+    if cached is not None:
+        st = os.stat(path)
+        cached[1].append(dict(row))
+        _CSV_CACHE[path] = ((st.st_mtime_ns, st.st_size), cached[1])
 
 
 def write_all(path: str, headers: list[str], rows: list[dict]) -> None:
@@ -114,16 +222,26 @@ def write_all(path: str, headers: list[str], rows: list[dict]) -> None:
         headers: Column headers.
         rows: List of dict rows to write.
     """
-    with open(path, "w", newline="", encoding="utf-8") as f:
+    # Any open append handle would keep writing at its old offset after the
+    # truncate, so drop it first.
+    _close_writer(path)
+    with open(path, "w", newline="", encoding="utf-8", buffering=1 << 16) as f:
         w = csv.DictWriter(f, fieldnames=headers)
         w.writeheader()
-        for r in rows:
-            w.writerow(r)
+        # One C-level call instead of a Python-level loop per row.
+        w.writerows(rows)
+    # The caller's rows are now the authoritative parsed content.
+    st = os.stat(path)
+    _CSV_CACHE[path] = ((st.st_mtime_ns, st.st_size), list(rows))
 
 
+@functools.lru_cache(maxsize=128)
 def days_mask_to_names(mask: str) -> str:
     """Convert binary days mask to human-readable names.
 
+    Results are memoized: the schedule view re-formats every row on each
+    reload and masks repeat heavily, so the hit rate is near 100%.
+
     Example:
         '1010100' -> 'Mon Wed Fri'
 
@@ -133,10 +251,40 @@ def days_mask_to_names(mask: str) -> str:
     Returns:
         Space-separated day names or '(none)' if no bits are set.
     """
-    DAYS_LOCAL = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
     if len(mask) != 7:
         return mask  # GOTCHA: if corrupt data, just show mask as-is.
-    return " ".join(DAYS_LOCAL[i] for i, ch in enumerate(mask) if ch == "1") or "(none)"
+    m = mask_to_int(mask)
+    return " ".join(DAYS[i] for i in range(7) if m & (1 << i)) or "(none)"
+
+
+def _parse_dt(s: str) -> datetime:
+    """Parse a DATE_FMT string via the C-level ISO fast path.
+
+    DATE_FMT strings ('2025-01-31 08:00') are valid ISO-8601, so
+    datetime.fromisoformat parses them directly — faster than both
+    strptime (which re-interprets the format per call) and manual int
+    slicing.
+
+    Args:
+        s: Timestamp string like '2025-01-31 08:00'.
+
+    Returns:
+        Parsed datetime. Raises ValueError on malformed input, same as
+        strptime would.
+    """
+    return datetime.fromisoformat(s)
+
+
+def _format_dt(dt: datetime) -> str:
+    """Format a datetime in DATE_FMT via an f-string (faster than strftime).
+
+    Args:
+        dt: Datetime to format.
+
+    Returns:
+        Timestamp string like '2025-01-31 08:00'.
+    """
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
 
 
 # ---------------- SnoozeManager ----------------
@@ -172,20 +320,11 @@ class SnoozeManager:
         """
         row = {
             "med_id": str(med_id),
-            "scheduled_dt": scheduled_dt.strftime(DATE_FMT),
-            "new_dt": new_dt.strftime(DATE_FMT),
+            "scheduled_dt": _format_dt(scheduled_dt),
+            "new_dt": _format_dt(new_dt),
         }
-
-        if PANDAS_OK:
-            try:
-                df = pd.read_csv(self.path)
-                df = pd.concat([df, pd.DataFrame([row])], ignore_index=True)
-                df.to_csv(self.path, index=False)
-                return
-            except Exception:
-                # GOTCHA: if pandas fails for some reason, default back to csv.
-                pass
-
+        # Appending one line is O(1); the old pandas path re-read and
+        # rewrote the whole file just to add a row.
         append_row(self.path, SNOOZE_HEADERS, row)
 
     def get_today(self) -> dict[tuple[str, str], datetime]:
@@ -197,32 +336,13 @@ class SnoozeManager:
         """
         today = datetime.now().strftime("%Y-%m-%d")
         out: dict[tuple[str, str], datetime] = {}
-
-        if PANDAS_OK:
-            try:
-                df = pd.read_csv(self.path)
-                df = df[df["new_dt"].astype(str).str.startswith(today)]
-                for _, r in df.iterrows():
-                    try:
-                        out[(str(r["med_id"]), str(r["scheduled_dt"]))] = datetime.strptime(
-                            str(r["new_dt"]), DATE_FMT
-                        )
-                    except Exception:
-                        # Ignore malformed rows.
-                        pass
-                return out
-            except Exception:
-                pass
-
-        # Fallback: manual CSV parsing
         for r in read_rows(self.path):
             nd = str(r.get("new_dt", ""))
-            if nd.startswith(today):
+            if nd.startswith(today) and _DT_RE.fullmatch(nd):
                 try:
-                    out[(str(r.get("med_id", "")), str(r.get("scheduled_dt", "")))] = datetime.strptime(
-                        nd, DATE_FMT
-                    )
-                except Exception:
+                    out[(str(r.get("med_id", "")), str(r.get("scheduled_dt", "")))] = _parse_dt(nd)
+                except ValueError:
+                    # Right shape but out-of-range fields (e.g. hour 99).
                     pass
         return out
 
@@ -234,25 +354,16 @@ class SnoozeManager:
         """
         cutoff = datetime.now() - timedelta(days=keep_days)
         kept: list[dict] = []
-
-        if PANDAS_OK:
-            try:
-                df = pd.read_csv(self.path)
-                if df.empty:
-                    return
-                df["__nd"] = pd.to_datetime(df["new_dt"], errors="coerce", format=DATE_FMT)
-                df = df[df["__nd"] > cutoff]
-                df.drop(columns=["__nd"], inplace=True, errors="ignore")
-                df.to_csv(self.path, index=False)
-                return
-            except Exception:
-                pass
-
         for r in read_rows(self.path):
+            nd = r.get("new_dt", "")
+            if not _DT_RE.fullmatch(nd):
+                continue
             try:
-                if datetime.strptime(r.get("new_dt", ""), DATE_FMT) > cutoff:
+                if _parse_dt(nd) > cutoff:
                     kept.append(r)
-            except Exception:
+            except ValueError:
+                # Right shape but out-of-range fields: drop like any
+                # other expired/invalid row.
                 pass
 
         write_all(self.path, SNOOZE_HEADERS, kept)
@@ -268,20 +379,39 @@ def coerce_days_mask_from_bools(day_bools: list[bool]) -> str:
     Returns:
         String of '1'/'0' characters (length 7).
     """
-    return "".join("1" if b else "0" for b in day_bools)
+    # Indexing a 2-char string avoids a branch per day.
+    return "".join("01"[b] for b in day_bools)
+
 
+def mask_to_int(mask: str) -> int:
+    """Convert a 7-character days mask into a 7-bit integer.
 
-def is_day_active(mask: str, d: date) -> bool:
-    """Check whether the given date is active according to the mask.
+    Bit i (Mon=0 .. Sun=6) is set when the mask has '1' at that index.
+    A malformed mask yields 0 (no active days), which previously fell out
+    of the length check returning False for every day.
 
     Args:
         mask: 7-character days mask ('1'/'0').
+
+    Returns:
+        Integer with one bit per active day.
+    """
+    if len(mask) != 7:
+        return 0
+    return sum(1 << i for i, ch in enumerate(mask) if ch == "1")
+
+
+def is_day_active(mask_int: int, d: date) -> bool:
+    """Check whether the given date is active according to the bit mask.
+
+    Args:
+        mask_int: 7-bit days mask from mask_to_int.
         d: Date to check.
 
     Returns:
-        True if mask at weekday index is '1', else False.
+        True if the bit for the date's weekday is set.
     """
-    return len(mask) == 7 and mask[d.weekday()] == "1"
+    return bool(mask_int & (1 << d.weekday()))
 
 
 def bucket_for_hour(h: int) -> str:
@@ -293,28 +423,133 @@ def bucket_for_hour(h: int) -> str:
     Returns:
         One of 'AM', 'Noon', 'PM', 'Bed'.
     """
-    for label, hours in BUCKETS.items():
-        if h in hours:
-            return label
-    return "AM"
+    return _HOUR_TO_BUCKET[h]
+
+
+class CompiledMed(NamedTuple):
+    """Schedule row with derived fields precomputed once per CSV load.
+
+    Attributes:
+        med_id: Medication ID (string form, as stored in the CSV).
+        med_name: Display name.
+        dose: Dose description.
+        times: Parsed times as (hour, minute) int pairs.
+        mask_int: Days mask packed into a 7-bit integer (Mon=bit 0).
+    """
+
+    med_id: str
+    med_name: str
+    dose: str
+    times: tuple[tuple[int, int], ...]
+    mask_int: int
+
+
+# Compiled form of the active schedule rows, tied to the CSV cache entry
+# so it is rebuilt only when the file actually changes.
+_COMPILED_SCHEDULE: tuple[tuple[int, int] | None, list[CompiledMed]] | None = None
+
+
+def compiled_schedule() -> list[CompiledMed]:
+    """Return active schedule rows with times/flags parsed once per load.
+
+    The scheduler re-expands the schedule every tick; parsing times_csv and
+    checking the active flag per tick is wasted work, so do it only when
+    read_rows hands back a fresh list.
+
+    Returns:
+        List of CompiledMed for active medications only.
+    """
+    global _COMPILED_SCHEDULE
+    rows = read_rows(SCHEDULE_CSV)
+    cached = _CSV_CACHE.get(SCHEDULE_CSV)
+    stat_key = cached[0] if cached is not None else None
+    if _COMPILED_SCHEDULE is not None and _COMPILED_SCHEDULE[0] == stat_key:
+        return _COMPILED_SCHEDULE[1]
+
+    compiled: list[CompiledMed] = []
+    for r in rows:
+        # Fast path first: clean data needs no strip/lower allocation.
+        val = r.get("active", "1")
+        if val not in _ACTIVE_TRUE and str(val).strip().lower() not in _ACTIVE_TRUE:
+            continue
+        times: list[tuple[int, int]] = []
+        for part in (r.get("times_csv", "") or "").split(","):
+            p = part.strip()
+            if len(p) == 5 and p[2] == ":":
+                try:
+                    hh, mm = map(int, p.split(":"))
+                    times.append((hh, mm))
+                except Exception:
+                    pass
+        compiled.append(
+            CompiledMed(
+                med_id=str(r.get("med_id", "")),
+                med_name=r.get("med_name", ""),
+                dose=r.get("dose", ""),
+                times=tuple(times),
+                mask_int=mask_to_int(r.get("days_mask", "1111111")),
+            )
+        )
+    _COMPILED_SCHEDULE = (stat_key, compiled)
+    return compiled
+
+
+# med_id -> row index over the schedule rows, tied to the CSV cache entry
+# like the compiled schedule, so edits and deletes look a row up in O(1)
+# instead of scanning the whole list.
+_SCHEDULE_BY_ID: tuple[tuple[int, int] | None, dict[str, dict]] | None = None
+
+
+def schedule_by_id() -> dict[str, dict]:
+    """Return a med_id -> row mapping over the current schedule rows.
+
+    The values are the same dicts held by the CSV cache, so mutating one
+    and calling write_all with read_rows(SCHEDULE_CSV) persists the edit.
+
+    Returns:
+        Dictionary mapping med_id string to its schedule row.
+    """
+    global _SCHEDULE_BY_ID
+    rows = read_rows(SCHEDULE_CSV)
+    cached = _CSV_CACHE.get(SCHEDULE_CSV)
+    stat_key = cached[0] if cached is not None else None
+    if _SCHEDULE_BY_ID is not None and _SCHEDULE_BY_ID[0] == stat_key:
+        return _SCHEDULE_BY_ID[1]
+    _SCHEDULE_BY_ID = (stat_key, {str(r.get("med_id", "")): r for r in rows})
+    return _SCHEDULE_BY_ID[1]
+
+
+# Monotonic ID counters, lazily seeded from the CSVs on first use so later
+# calls never have to re-scan the files just to compute an ID.
+_NEXT_MED_ID: int | None = None
+_NEXT_LOG_ID: int | None = None
 
 
 def next_med_id(rows: list[dict]) -> int:
-    """Return next integer medication ID based on existing rows.
+    """Return the next integer medication ID.
+
+    The first call seeds a module-level counter from the existing rows;
+    later calls just increment it.
 
     Args:
-        rows: List of existing schedule rows.
+        rows: List of existing schedule rows (used only for the first call).
 
     Returns:
         Integer > max existing ID (or 1 if none).
     """
-    max_id = 0
-    for r in rows:
-        try:
-            max_id = max(max_id, int(r["med_id"]))
-        except Exception:
-            pass
-    return max_id + 1
+    global _NEXT_MED_ID
+    if _NEXT_MED_ID is None:
+        # isdigit-guarded generator: no per-row exception frames.
+        _NEXT_MED_ID = (
+            max(
+                (int(r["med_id"]) for r in rows if r.get("med_id", "").isdigit()),
+                default=0,
+            )
+            + 1
+        )
+    new_id = _NEXT_MED_ID
+    _NEXT_MED_ID += 1
+    return new_id
 
 
 def log_action(med_id: str, sched_dt: datetime, action: str, actual_dt: datetime | None = None) -> None:
@@ -326,22 +561,47 @@ def log_action(med_id: str, sched_dt: datetime, action: str, actual_dt: datetime
         action: One of 'taken', 'skipped', 'snoozed'.
         actual_dt: When the user actually took the action (defaults to now).
     """
-    rows = read_rows(LOG_CSV)
-    next_id = 1
-    for r in rows:
-        try:
-            next_id = max(next_id, int(r["log_id"]) + 1)
-        except Exception:
-            pass
+    global _NEXT_LOG_ID
+    if _NEXT_LOG_ID is None:
+        _NEXT_LOG_ID = (
+            max(
+                (
+                    int(r["log_id"])
+                    for r in read_rows(LOG_CSV)
+                    if r.get("log_id", "").isdigit()
+                ),
+                default=0,
+            )
+            + 1
+        )
 
     row = {
-        "log_id": str(next_id),
+        "log_id": str(_NEXT_LOG_ID),
         "med_id": str(med_id),
-        "scheduled_dt": sched_dt.strftime(DATE_FMT),
+        "scheduled_dt": _format_dt(sched_dt),
         "action": action,
-        "actual_dt": (actual_dt or datetime.now()).strftime(DATE_FMT),
+        "actual_dt": _format_dt(actual_dt or datetime.now()),
     }
     append_row(LOG_CSV, LOG_HEADERS, row)
+    _log_actions()[(row["med_id"], row["scheduled_dt"])] = action
+    _NEXT_LOG_ID += 1
+
+
+# Index of logged doses: (med_id, scheduled_dt) -> last action. Built
+# lazily from the log CSV and kept in sync by log_action, so both the
+# already-logged check and the grid's action lookup are O(1).
+_LOG_ACTIONS: dict[tuple[str, str], str] | None = None
+
+
+def _log_actions() -> dict[tuple[str, str], str]:
+    """Return the (med_id, scheduled_dt) -> action map, building it on first use."""
+    global _LOG_ACTIONS
+    if _LOG_ACTIONS is None:
+        _LOG_ACTIONS = {
+            (r.get("med_id", ""), r.get("scheduled_dt", "")): (r.get("action", "") or "")
+            for r in read_rows(LOG_CSV)
+        }
+    return _LOG_ACTIONS
 
 
 def is_already_logged(med_id: str, sched_dt: datetime) -> bool:
@@ -354,11 +614,7 @@ def is_already_logged(med_id: str, sched_dt: datetime) -> bool:
     Returns:
         True if there is already a row for (med_id, scheduled_dt).
     """
-    key = (str(med_id), sched_dt.strftime(DATE_FMT))
-    for r in read_rows(LOG_CSV):
-        if r.get("med_id") == key[0] and r.get("scheduled_dt") == key[1]:
-            return True
-    return False
+    return (str(med_id), _format_dt(sched_dt)) in _log_actions()
 
 
 # ---------------- Tkinter app ----------------
@@ -418,16 +674,119 @@ class PillBoxApp(tk.Tk):
 
         self._build_grid_tab()
         self._build_edit_tab()
-        self._build_summary_tab()
-
-        ttk.Label(self, text="PillBox v2 — Version 2 progress", anchor="center").pack(
+        # The Summary tab (and the matplotlib import behind it) is built
+        # lazily the first time the user actually opens it.
+        self._summary_built = False
+        self.tabs.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+        # Status bar: non-blocking feedback for saves/deletes, so routine
+        # confirmations no longer stall the event loop in a modal dialog.
+        self.status_var = tk.StringVar(value="PillBox v2 — Version 2 progress")
+        ttk.Label(self, textvariable=self.status_var, anchor="center").pack(
             side="bottom", fill="x", pady=6
         )
 
-        # Initial draw + scheduler loop.
+        # Background CSV loader: one worker thread runs read jobs so the
+        # Tk main thread never blocks on disk I/O; results are marshalled
+        # back to the UI through a queue drained with after().
+        self._io_jobs: queue.Queue = queue.Queue()
+        self._io_results: queue.Queue = queue.Queue()
+        threading.Thread(target=self._io_worker, daemon=True).start()
+        self.after(50, self._drain_io)
+
+        # Memoized week expansion: (cache key, items). Rebuilt only when
+        # the date, the schedule file or today's snoozes change.
+        self._week_cache: tuple | None = None
+
+        # Last summary tally: (log stat key + date, counts). Lets refreshes
+        # skip both the recount and the chart redraw when nothing changed.
+        self._summary_cache: tuple | None = None
+
+        # True while a coalesced grid repaint is queued via after_idle.
+        self._refresh_pending = False
+
+        # Min-heap of today's upcoming doses as (scheduled_dt, seq, item),
+        # rebuilt whenever the week list changes; the tick only pops what
+        # is actually due instead of rescanning the whole week.
+        self._due_heap: list[tuple[int, int, dict]] = []
+        self._due_week: list[dict] | None = None
+        self._due_seq = 0  # Unique tiebreak so equal times never compare dicts.
+
+        # Initial draw + scheduler loop. The first paint is synchronous so
+        # the window never shows an empty grid.
+        self._scheduler_after_id: str | None = None
         self._update_grid_colors()
         self._scheduler_loop()
 
+    # ---------- background I/O ----------
+    def _run_async(self, fn, callback) -> None:
+        """Run fn() on the I/O worker and call callback(result) on the UI thread.
+
+        Args:
+            fn: Zero-argument callable executed off the main thread.
+            callback: Called with fn's result from the Tk event loop.
+        """
+        self._io_jobs.put((fn, callback))
+
+    def _io_worker(self) -> None:
+        """Worker-thread loop: run queued jobs and post results back."""
+        while True:
+            fn, callback = self._io_jobs.get()
+            try:
+                result = fn()
+            except Exception as e:
+                # GOTCHA: same console-only error policy as the scheduler.
+                print("I/O worker error:", e)
+                result = None
+            # Always post the callback, even on failure: _scheduler_tick
+            # re-arms the after() chain from its callback, so swallowing
+            # the result here would silently stop the scheduler for good.
+            self._io_results.put((callback, result))
+
+    def _drain_io(self) -> None:
+        """Apply finished worker results on the UI thread."""
+        try:
+            while True:
+                callback, result = self._io_results.get_nowait()
+                callback(result)
+        except queue.Empty:
+            pass
+        self.after(50, self._drain_io)
+
+    def _on_schedule_written(self, _result) -> None:
+        """Refresh the views once a schedule write has landed on disk."""
+        self._reload_schedule_view()
+        self._reschedule_scheduler()
+
+    def _write_schedule_async(self, rows: list[dict]) -> None:
+        """Persist the schedule rows on the I/O worker, then refresh views.
+
+        Callers mutate the cached row dicts in place first, so the UI can
+        repaint immediately from the cache; the follow-up refresh runs once
+        the write lands and the file's stat key has moved on.
+
+        Args:
+            rows: Full schedule row list to write out.
+        """
+        self._run_async(
+            lambda: write_all(SCHEDULE_CSV, SCHEDULE_HEADERS, rows),
+            self._on_schedule_written,
+        )
+
+    def _append_schedule_async(self, row: dict) -> None:
+        """Append one schedule row on the I/O worker, then refresh views.
+
+        Every SCHEDULE_CSV write goes through the single worker so an
+        append can never race an in-flight write_all on the same file.
+
+        Args:
+            row: New schedule row to append.
+        """
+        self._run_async(
+            lambda: append_row(SCHEDULE_CSV, SCHEDULE_HEADERS, row),
+            self._on_schedule_written,
+        )
+
     # ---------- week schedule (Mon..Sun) ----------
     def _build_week_schedule(self) -> list[dict]:
         """Build a sorted list of all scheduled doses for the current week.
@@ -437,47 +796,59 @@ class PillBoxApp(tk.Tk):
                 med_id, med_name, dose, scheduled_dt, scheduled_iso
             Snoozes for *today* are applied as overrides.
         """
-        rows = read_rows(SCHEDULE_CSV)
+        meds = compiled_schedule()
         today = date.today()
         monday = today - timedelta(days=today.weekday())
         today_snoozes = self.snooze_mgr.get_today()
+
+        # Reuse the previous expansion when nothing it depends on changed.
+        sched_entry = _CSV_CACHE.get(SCHEDULE_CSV)
+        cache_key = (
+            today,
+            sched_entry[0] if sched_entry is not None else None,
+            frozenset(today_snoozes.items()),
+        )
+        if self._week_cache is not None and self._week_cache[0] == cache_key:
+            return self._week_cache[1]
+
         out: list[dict] = []
 
         for d_off in range(7):
             d = monday + timedelta(days=d_off)
-            for r in rows:
-                # Only active meds are scheduled
-                if str(r.get("active", "1")).strip().lower() not in ["1", "true", "yes"]:
-                    continue
-                if not is_day_active(r.get("days_mask", "1111111"), d):
+            for med in meds:
+                if not med.mask_int & (1 << d.weekday()):
                     continue
 
-                for part in (r.get("times_csv", "") or "").split(","):
-                    p = part.strip()
-                    if len(p) == 5 and p[2] == ":":
-                        try:
-                            hh, mm = map(int, p.split(":"))
-                            sched = datetime.combine(d, time(hh, mm))
-                            iso = sched.strftime(DATE_FMT)
-
-                            # Apply snoozes only to today's doses
-                            if d == today and (str(r["med_id"]), iso) in today_snoozes:
-                                sched = today_snoozes[(str(r["med_id"]), iso)]
-                                iso = sched.strftime(DATE_FMT)
-
-                            out.append(
-                                {
-                                    "med_id": str(r["med_id"]),
-                                    "med_name": r["med_name"],
-                                    "dose": r["dose"],
-                                    "scheduled_dt": sched,
-                                    "scheduled_iso": iso,
-                                }
-                            )
-                        except Exception:
-                            pass
-
-        return sorted(out, key=lambda d: d["scheduled_dt"])
+                for hh, mm in med.times:
+                    sched = datetime.combine(d, time(hh, mm))
+                    iso = _format_dt(sched)
+
+                    # Apply snoozes only to today's doses
+                    if d == today and (med.med_id, iso) in today_snoozes:
+                        sched = today_snoozes[(med.med_id, iso)]
+                        iso = _format_dt(sched)
+
+                    out.append(
+                        {
+                            "med_id": med.med_id,
+                            "med_name": med.med_name,
+                            "dose": med.dose,
+                            "scheduled_dt": sched,
+                            "scheduled_iso": iso,
+                            # Paint-ready fields so _update_grid_colors
+                            # does not re-derive them per refresh.
+                            "bucket": bucket_for_hour(sched.hour),
+                            "col": sched.weekday(),
+                            "pretty_time": f"{sched.hour:02d}:{sched.minute:02d}",
+                            # Epoch seconds so the due-window test in the
+                            # tick is an int compare, not a timedelta.
+                            "sched_epoch": int(sched.timestamp()),
+                        }
+                    )
+
+        out.sort(key=lambda d: d["scheduled_dt"])
+        self._week_cache = (cache_key, out)
+        return out
 
     # ---------- grid tab ----------
     def _build_grid_tab(self) -> None:
@@ -497,6 +868,9 @@ class PillBoxApp(tk.Tk):
             ttk.Label(frame, text=day, style="Bold.TLabel").grid(row=0, column=j, padx=6, pady=6)
 
         self.grid_labels: dict[tuple[str, int], tk.Label] = {}
+        # Last (bg, text) applied per cell, so repaints can skip no-op
+        # .config calls (each one forces an expensive Tk redraw).
+        self._cell_state: dict[tuple[str, int], tuple[str, str]] = {}
 
         # Create one label per bucket/day.
         for i, bucket in enumerate(["AM", "Noon", "PM", "Bed"], start=1):
@@ -541,55 +915,93 @@ class PillBoxApp(tk.Tk):
         self._draw_summary()
         self.update_idletasks()
 
-    def _update_grid_colors(self) -> None:
-        """Fill the weekly grid based on schedule, logs and snoozes."""
-        # Reset all cells to idle.
-        for lbl in self.grid_labels.values():
-            lbl.config(bg="#f2f2f2", text=" ")
+    def _set_status(self, text: str) -> None:
+        """Show a message in the bottom status bar.
 
-        week = self._build_week_schedule()
-        logs = read_rows(LOG_CSV)
+        Non-blocking replacement for the old showinfo confirmations, so
+        routine saves and deletes no longer stall the event loop behind a
+        modal dialog.
 
-        # Map (med_id, scheduled_iso) -> action string
-        act_map = {
-            (r.get("med_id", ""), r.get("scheduled_dt", "")): (r.get("action", "") or "")
-            for r in logs
+        Args:
+            text: Message to display.
+        """
+        self.status_var.set(f"{text}  ({datetime.now():%H:%M:%S})")
+
+    def _request_refresh(self) -> None:
+        """Coalesce grid repaints into a single idle-time callback.
+
+        Back-to-back mutations (log action, popup close, next popup) each
+        used to force a synchronous flush; now the first request schedules
+        one idle repaint and the rest piggyback on it.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.after_idle(self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        """Run the coalesced grid repaint scheduled by _request_refresh."""
+        self._refresh_pending = False
+        self._update_grid_colors()
+
+    def _update_grid_colors(
+        self, week: list[dict] | None = None, now: datetime | None = None
+    ) -> None:
+        """Fill the weekly grid based on schedule, logs and snoozes.
+
+        Args:
+            week: Week schedule from _build_week_schedule; built here when
+                not supplied, so callers that already have one (the
+                scheduler loop) can avoid building it twice.
+            now: Current timestamp; defaults to datetime.now(). Passed in
+                by the scheduler so one tick uses one consistent clock.
+        """
+        # Desired final (bg, text) per cell; start from idle and overwrite,
+        # then apply in a single pass so each cell gets at most one .config.
+        cells: dict[tuple[str, int], tuple[str, str]] = {
+            k: ("#f2f2f2", " ") for k in self.grid_labels
         }
 
-        today = date.today()
-        now = datetime.now()
+        if week is None:
+            week = self._build_week_schedule()
+
+        if now is None:
+            now = datetime.now()
+        today = now.date()
+
+        # (med_id, scheduled_iso) -> action, maintained incrementally by
+        # log_action; lookups are O(1) so no per-refresh rebuild is needed.
+        act_map = _log_actions()
 
         for item in week:
             dt = item["scheduled_dt"]
-            bucket = bucket_for_hour(dt.hour)
-            col = dt.weekday()
-            key = (item["med_id"], dt.strftime(DATE_FMT))
-            cell = self.grid_labels.get((bucket, col))
-            if not cell:
+            key = (item["med_id"], item["scheduled_iso"])
+            cell_key = (item["bucket"], item["col"])
+            if cell_key not in cells:
                 continue
 
-            text = f"{item['med_name']}\n{item['dose']}\n{dt.strftime('%H:%M')}"
-            if key in act_map:
-                a = act_map[key]
-                if a == "taken":
-                    cell.config(bg="#90ee90", text=text)
-                elif a == "skipped":
-                    cell.config(bg="#ffcccb", text=text)
-                elif a == "snoozed":
-                    cell.config(
-                        bg="#d0e0ff",
-                        text=f"{item['med_name']}\n(snoozed)\n{dt.strftime('%H:%M')}",
-                    )
-                else:
-                    cell.config(text=text)
-            else:
+            bg = cells[cell_key][0]
+            text = f"{item['med_name']}\n{item['dose']}\n{item['pretty_time']}"
+            a = act_map.get(key)  # One lookup covers the test and the fetch.
+            if a == "taken":
+                bg = "#90ee90"
+            elif a == "skipped":
+                bg = "#ffcccb"
+            elif a == "snoozed":
+                bg = "#d0e0ff"
+                text = f"{item['med_name']}\n(snoozed)\n{item['pretty_time']}"
+            elif a is None:
                 # Highlight "due soon" for today's items only (±15 minutes)
                 if dt.date() == today and abs((now - dt).total_seconds()) <= 15 * 60:
-                    cell.config(bg="#fff59d", text=text)
-                else:
-                    cell.config(text=text)
+                    bg = "#fff59d"
+            cells[cell_key] = (bg, text)
 
-        self.update_idletasks()
+        # Apply the diff: touch only cells whose state actually changed,
+        # and let Tk batch the redraws on return to the event loop.
+        for cell_key, state in cells.items():
+            if self._cell_state.get(cell_key) != state:
+                self.grid_labels[cell_key].config(bg=state[0], text=state[1])
+                self._cell_state[cell_key] = state
 
     # ---------- Add/Edit tab ----------
     def _build_edit_tab(self) -> None:
@@ -729,7 +1141,6 @@ class PillBoxApp(tk.Tk):
                 self.times_listbox.delete(0, tk.END)
                 for t in self.current_times:
                     self.times_listbox.insert(tk.END, t)
-        self.update_idletasks()
 
     def _remove_selected_time(self) -> None:
         """Remove currently selected time from the listbox and current_times."""
@@ -739,25 +1150,35 @@ class PillBoxApp(tk.Tk):
             if val in self.current_times:
                 self.current_times.remove(val)
             self.times_listbox.delete(sel[0])
-        self.update_idletasks()
 
     def _reload_schedule_view(self) -> None:
         """Reload the Current Medications table from med_schedule.csv."""
-        # Clear previous rows
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-
-        # Insert rows with readable day names
-        for r in read_rows(SCHEDULE_CSV):
-            display_row = [
+        # Clear previous rows in one Tk call instead of one per child.
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+
+        # Pre-format all rows, then insert; keeps Tk round-trips to the
+        # inserts themselves.
+        display_rows = [
+            (
                 r.get("med_id", ""),
                 r.get("med_name", ""),
                 r.get("dose", ""),
                 r.get("times_csv", ""),
                 days_mask_to_names(r.get("days_mask", "1111111")),
                 r.get("active", "1"),
-            ]
-            self.tree.insert("", tk.END, values=display_row)
+            )
+            for r in read_rows(SCHEDULE_CSV)
+        ]
+        # Hide the columns during the insert burst so Tk does not redraw
+        # the view once per row, then restore them for a single paint.
+        self.tree.configure(displaycolumns=())
+        try:
+            for display_row in display_rows:
+                self.tree.insert("", "end", values=display_row)
+        finally:
+            self.tree.configure(displaycolumns="#all")
 
     # --------- helper to load a row into the form ---------
     def _load_med_into_form(self, med_row: dict) -> None:
@@ -787,7 +1208,7 @@ class PillBoxApp(tk.Tk):
 
         # Active
         active_val = str(med_row.get("active", "1")).strip().lower()
-        self.var_active.set(active_val in ["1", "true", "yes"])
+        self.var_active.set(active_val in _ACTIVE_TRUE)
 
     def _edit_selected_med(self) -> None:
         """Load the selected medication row into the form for editing."""
@@ -844,24 +1265,20 @@ class PillBoxApp(tk.Tk):
             return
 
         rows = read_rows(SCHEDULE_CSV)
-        changed = False
-        for r in rows:
-            if str(r.get("med_id", "")) == med_id:
-                r["active"] = "0"
-                changed = True
-
-        if not changed:
+        r = schedule_by_id().get(med_id)
+        if r is None:
             messagebox.showerror("Delete", f"Medication with id={med_id} not found.")
             return
 
-        write_all(SCHEDULE_CSV, SCHEDULE_HEADERS, rows)
+        if r.get("active") != "0":
+            r["active"] = "0"
+            self._write_schedule_async(rows)
         if self.current_edit_med_id == med_id:
             self.current_edit_med_id = None
 
         self._reload_schedule_view()
-        self._update_grid_colors()
-        self.update_idletasks()
-        messagebox.showinfo("Delete", f"Medication {med_id} has been marked inactive.")
+        self._reschedule_scheduler()
+        self._set_status(f"Medication {med_id} marked inactive.")
 
     def _save_medication(self) -> None:
         """Save the current form as either a new medication or an update.
@@ -888,21 +1305,22 @@ class PillBoxApp(tk.Tk):
         # Editing an existing medication
         if self.current_edit_med_id is not None:
             med_id = self.current_edit_med_id
-            updated = False
-            for r in rows:
-                if str(r.get("med_id", "")) == med_id:
-                    r["med_name"] = name
-                    r["dose"] = dose
-                    r["times_csv"] = ",".join(times)
-                    r["days_mask"] = days_mask
-                    r["active"] = active
-                    updated = True
-                    break
-            if not updated:
+            r = schedule_by_id().get(med_id)
+            if r is None:
                 messagebox.showerror("Save", f"Could not find medication id={med_id} to update.")
                 return
-            write_all(SCHEDULE_CSV, SCHEDULE_HEADERS, rows)
-            messagebox.showinfo("Saved", f"Medication id={med_id} updated.")
+            fields = {
+                "med_name": name,
+                "dose": dose,
+                "times_csv": ",".join(times),
+                "days_mask": days_mask,
+                "active": active,
+            }
+            # Only rewrite the file when something actually changed.
+            if any(r.get(k) != v for k, v in fields.items()):
+                r.update(fields)
+                self._write_schedule_async(rows)
+            self._set_status(f"Medication id={med_id} updated.")
             self.current_edit_med_id = None
         else:
             # New medication
@@ -915,12 +1333,11 @@ class PillBoxApp(tk.Tk):
                 "days_mask": days_mask,
                 "active": active,
             }
-            append_row(SCHEDULE_CSV, SCHEDULE_HEADERS, row)
-            messagebox.showinfo("Saved", f"Medication '{name}' added (id={new_id}).")
+            self._append_schedule_async(row)
+            self._set_status(f"Medication '{name}' added (id={new_id}).")
 
         self._reload_schedule_view()
-        self._update_grid_colors()
-        self.update_idletasks()
+        self._reschedule_scheduler()
 
         # Clear inputs for next time.
         self.ent_name.delete(0, tk.END)
@@ -929,6 +1346,12 @@ class PillBoxApp(tk.Tk):
         self.times_listbox.delete(0, tk.END)
 
     # ---------- Summary tab ----------
+    def _on_tab_changed(self, _event) -> None:
+        """Build the Summary tab contents the first time it is opened."""
+        if not self._summary_built and self.tabs.select() == str(self.tab_summary):
+            self._summary_built = True
+            self._build_summary_tab()
+
     def _build_summary_tab(self) -> None:
         """Create the Summary tab with 7-day action counts."""
         ttk.Label(
@@ -939,6 +1362,30 @@ class PillBoxApp(tk.Tk):
 
         self.summary_container = ttk.Frame(self.tab_summary)
         self.summary_container.pack(fill="both", expand=True)
+
+        # Build the Figure and Tk canvas once; redraws only refresh the
+        # axes. Recreating them per refresh costs hundreds of ms.
+        if _load_matplotlib():
+            Figure, FigureCanvasTkAgg = _MPL
+            self.summary_fig = Figure(figsize=(5.6, 3.4), dpi=120)
+            self.summary_ax = self.summary_fig.add_subplot(111)
+            # Static chart furniture and the bar artists are created once;
+            # refreshes only move the bar heights.
+            self.summary_bars = self.summary_ax.bar(ACTIONS, (0, 0, 0))
+            self.summary_ax.set_title("Actions in last 7 days")
+            self.summary_ax.set_ylabel("Count")
+            self.summary_canvas = FigureCanvasTkAgg(
+                self.summary_fig, master=self.summary_container
+            )
+            self.summary_canvas.get_tk_widget().pack()
+        else:
+            # Fallback chart: plain Tk canvas rectangles. Far cheaper than
+            # matplotlib and good enough for three bars.
+            self.summary_tk_canvas = tk.Canvas(
+                self.summary_container, width=560, height=340, bg="white"
+            )
+            self.summary_tk_canvas.pack()
+
         self._draw_summary()
 
         util = ttk.Frame(self.tab_summary)
@@ -949,64 +1396,166 @@ class PillBoxApp(tk.Tk):
 
     def _draw_summary(self) -> None:
         """Render a simple bar chart of counts of taken/snoozed/skipped in last 7 days."""
-        for w in self.summary_container.winfo_children():
-            w.destroy()
-
-        if not MATPLOTLIB_OK:
-            ttk.Label(
-                self.summary_container, text="Matplotlib not available. Chart disabled."
-            ).pack(pady=16)
+        if not self._summary_built:
+            # Tab never opened: nothing to draw yet.
             return
-
         logs = read_rows(LOG_CSV)
-        cutoff = datetime.now() - timedelta(days=7)
-        counts = {"taken": 0, "snoozed": 0, "skipped": 0}
+        # Key the tally on the log file's stat key plus the date: same log
+        # and same day means the same bars, so skip the recount and the
+        # redraw. (The 7-day cutoff slides per call, but a dose aging out
+        # mid-day only matters once the date flips.)
+        log_entry = _CSV_CACHE.get(LOG_CSV)
+        now = datetime.now()
+        cache_key = (log_entry[0] if log_entry is not None else None, now.date())
+        if self._summary_cache is not None and self._summary_cache[0] == cache_key:
+            return
 
-        for r in logs:
-            try:
-                when = datetime.strptime(r.get("actual_dt", ""), DATE_FMT)
-                if when >= cutoff:
-                    a = (r.get("action") or "").strip()
-                    if a in counts:
-                        counts[a] += 1
-            except Exception:
-                pass
+        # Lexicographic order matches chronological order for DATE_FMT
+        # strings, so the cutoff test needs no datetime parsing at all.
+        # The log is append-only in time order: walk it backwards and stop
+        # at the first row older than the cutoff, so the tally costs
+        # O(recent rows) instead of O(entire history).
+        cutoff_str = _format_dt(now - timedelta(days=7))
+        counts = dict.fromkeys(ACTIONS, 0)
+        for r in reversed(logs):
+            nd = r.get("actual_dt", "")
+            # Only a well-formed, genuinely older timestamp ends the walk;
+            # a hand-edited or blank row is skipped, not treated as the
+            # start of the old history.
+            if not _DT_RE.fullmatch(nd):
+                continue
+            if nd < cutoff_str:
+                break
+            # log_action writes the action verbatim, so no per-row strip
+            # or normalization is needed; unknown values just don't count.
+            a = r.get("action", "")
+            if a in counts:
+                counts[a] += 1
+        self._summary_cache = (cache_key, counts)
+
+        if MATPLOTLIB_OK:
+            # Move the persistent bars instead of clearing the axes, so
+            # ticks, spines and labels are not re-rendered per refresh.
+            for bar, key in zip(self.summary_bars, ACTIONS):
+                bar.set_height(counts[key])
+            self.summary_ax.set_ylim(0, max(max(counts.values()), 1) * 1.1)
+            self.summary_canvas.draw_idle()
+            self.update_idletasks()
+        else:
+            self._draw_summary_canvas(counts)
 
-        fig = Figure(figsize=(5.6, 3.4), dpi=120)
-        ax = fig.add_subplot(111)
-        ax.bar(list(counts.keys()), list(counts.values()))
-        ax.set_title("Actions in last 7 days")
-        ax.set_ylabel("Count")
+    def _draw_summary_canvas(self, counts: dict[str, int]) -> None:
+        """Draw the 7-day bars with plain Tk canvas primitives.
 
-        canvas = FigureCanvasTkAgg(fig, master=self.summary_container)
-        canvas.draw()
-        canvas.get_tk_widget().pack()
-        self.update_idletasks()
+        Args:
+            counts: Mapping of action name to count for the chart.
+        """
+        c = self.summary_tk_canvas
+        c.delete("all")
+        c.create_text(280, 18, text="Actions in last 7 days")
+        max_v = max(counts.values()) or 1
+        x = 80
+        for name, v in counts.items():
+            h = (v / max_v) * 250
+            c.create_rectangle(x, 300 - h, x + 80, 300, fill="steelblue")
+            c.create_text(x + 40, 314, text=name)
+            c.create_text(x + 40, 300 - h - 10, text=str(v))
+            x += 150
 
     # ---------- scheduler (today only for popups) ----------
     def _scheduler_loop(self) -> None:
-        """Periodic loop: check for due doses for today and show popup if needed."""
+        """Periodic loop: build the schedule off-thread, then run the tick."""
+        self._run_async(self._build_week_schedule, self._scheduler_tick)
+
+    def _scheduler_tick(self, week: list[dict] | None) -> None:
+        """Check for due doses for today and show popup if needed.
+
+        Args:
+            week: Week schedule built by the I/O worker.
+        """
+        now = datetime.now()
+        now_epoch = int(now.timestamp())
         try:
-            now = datetime.now()
-            today = date.today()
-            for item in self._build_week_schedule():
-                if item["scheduled_dt"].date() != today:
-                    continue
-                sched = item["scheduled_dt"]
+            today = now.date()
+            if week is not None and week is not self._due_week:
+                # Week list changed (schedule edit, snooze, day rollover):
+                # rebuild the heap of today's doses, keyed by epoch seconds
+                # so every heap comparison is an int compare.
+                self._due_week = week
+                self._due_heap = [
+                    (item["sched_epoch"], self._due_seq + i, item)
+                    for i, item in enumerate(week)
+                    if item["scheduled_dt"].date() == today
+                ]
+                self._due_seq += len(week)
+                heapq.heapify(self._due_heap)
+
+            # Pop only doses whose window has started; long-past entries
+            # fall out without a popup, exactly as the old full scan
+            # skipped them.
+            while self._due_heap and self._due_heap[0][0] <= now_epoch + 60:
+                epoch, _, item = heapq.heappop(self._due_heap)
                 # Within 60 seconds of scheduled time and not yet logged?
                 if (
-                    abs((now - sched).total_seconds()) <= 60
-                    and not is_already_logged(item["med_id"], sched)
+                    abs(now_epoch - epoch) <= 60
+                    and not is_already_logged(item["med_id"], item["scheduled_dt"])
                 ):
                     self._show_due_popup(item)
+                    # Leave it queued: if the popup is dismissed without
+                    # logging, the next tick re-raises it while due.
+                    self._due_seq += 1
+                    heapq.heappush(self._due_heap, (epoch, self._due_seq, item))
                     break
         except Exception as e:
             # GOTCHA: logging only to console; in a bigger app we might want a log file.
             print("Scheduler error:", e)
 
-        self._update_grid_colors()
-        # Re-run scheduler every 10 seconds.
-        self.after(10_000, self._scheduler_loop)
+        self._update_grid_colors(week, now)
+        # Sleep until the next instant anything can change instead of a
+        # fixed poll; _reschedule_scheduler cuts the sleep short on edits.
+        self._scheduler_after_id = self.after(
+            self._next_tick_ms(week, now), self._scheduler_loop
+        )
+
+    def _next_tick_ms(self, week: list[dict] | None, now: datetime) -> int:
+        """Compute how long the scheduler can sleep until its next tick.
+
+        Args:
+            week: Week schedule (may be None if the tick failed).
+            now: Timestamp the current tick ran at.
+
+        Returns:
+            Delay in milliseconds. Ticks every 10s while a dose sits
+            inside the ±15 min due-soon window so the highlight and popup
+            checks stay fresh; otherwise wakes when the next dose enters
+            that window, and idles until midnight (when the week view
+            rolls over) if nothing is coming up.
+        """
+        # Day rollover rebuilds the week, so never sleep past midnight.
+        wake = datetime.combine(now.date() + timedelta(days=1), time.min)
+        if week:
+            for item in week:
+                delta = (item["scheduled_dt"] - now).total_seconds()
+                if -900 <= delta <= 900:
+                    return 10_000
+                if delta > 900:
+                    wake = min(wake, item["scheduled_dt"] - timedelta(minutes=15))
+                    break
+        return max(1000, int((wake - now).total_seconds() * 1000))
+
+    def _reschedule_scheduler(self) -> None:
+        """Cancel the pending scheduler tick and run one immediately.
+
+        Called after mutations (save/delete/snooze) so a newly added or
+        moved dose is picked up without waiting out the current sleep.
+        """
+        if self._scheduler_after_id is not None:
+            try:
+                self.after_cancel(self._scheduler_after_id)
+            except Exception:
+                pass
+            self._scheduler_after_id = None
+        self._scheduler_loop()
 
     def _show_due_popup(self, item: dict) -> None:
         """Show a modal popup when a dose is due.
@@ -1043,16 +1592,43 @@ class PillBoxApp(tk.Tk):
         btns = ttk.Frame(top)
         btns.pack(pady=10)
 
-        def do_take() -> None:
-            """Mark dose as taken and update grid."""
-            log_action(item["med_id"], item["scheduled_dt"], "taken", datetime.now())
-            self._update_grid_colors()
-            self.update_idletasks()
-            top.destroy()
-            messagebox.showinfo("Logged", "Marked as TAKEN.")
+        ttk.Button(
+            btns,
+            text="Take",
+            command=lambda: self._do_popup_action(item, top, "taken"),
+        ).pack(side="left", padx=6)
+        ttk.Button(
+            btns,
+            text="Snooze",
+            command=lambda: self._do_popup_action(item, top, "snoozed", snooze_var),
+        ).pack(side="left", padx=6)
+        ttk.Button(
+            btns,
+            text="Skip",
+            command=lambda: self._do_popup_action(item, top, "skipped"),
+        ).pack(side="left", padx=6)
+        ttk.Button(top, text="Close", command=top.destroy).pack(pady=(0, 12))
+        top.update()  # Paint immediately so user sees popup right away.
+
+    def _do_popup_action(
+        self,
+        item: dict,
+        top: tk.Toplevel,
+        action: str,
+        snooze_var: tk.StringVar | None = None,
+    ) -> None:
+        """Handle a popup button press: log the action, refresh, close.
 
-        def do_snooze() -> None:
-            """Snooze dose for selected minutes and log it."""
+        One parameterized handler replaces the three near-identical
+        closures the popup used to allocate on every show.
+
+        Args:
+            item: Schedule item the popup was shown for.
+            top: Popup window to close.
+            action: One of 'taken', 'snoozed', 'skipped'.
+            snooze_var: StringVar holding the snooze minutes (snooze only).
+        """
+        if action == "snoozed":
             try:
                 mins = int(snooze_var.get())
             except Exception:
@@ -1060,24 +1636,14 @@ class PillBoxApp(tk.Tk):
             new_dt = item["scheduled_dt"] + timedelta(minutes=mins)
             self.snooze_mgr.add(item["med_id"], item["scheduled_dt"], new_dt)
             log_action(item["med_id"], item["scheduled_dt"], "snoozed", datetime.now())
-            self._update_grid_colors()
-            self.update_idletasks()
+            self._reschedule_scheduler()
             top.destroy()
             messagebox.showinfo("Snoozed", f"Snoozed for {mins} minutes.")
-
-        def do_skip() -> None:
-            """Mark dose as skipped and update grid."""
-            log_action(item["med_id"], item["scheduled_dt"], "skipped", datetime.now())
-            self._update_grid_colors()
-            self.update_idletasks()
+        else:
+            log_action(item["med_id"], item["scheduled_dt"], action, datetime.now())
+            self._request_refresh()
             top.destroy()
-            messagebox.showinfo("Logged", "Marked as SKIPPED.")
-
-        ttk.Button(btns, text="Take", command=do_take).pack(side="left", padx=6)
-        ttk.Button(btns, text="Snooze", command=do_snooze).pack(side="left", padx=6)
-        ttk.Button(btns, text="Skip", command=do_skip).pack(side="left", padx=6)
-        ttk.Button(top, text="Close", command=top.destroy).pack(pady=(0, 12))
-        top.update()  # Paint immediately so user sees popup right away.
+            messagebox.showinfo("Logged", f"Marked as {action.upper()}.")
 
 
 # ---------------- main ----------------
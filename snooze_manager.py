@@ -3,30 +3,51 @@ class SnoozeManager:
     def __init__(self, SNOOZE_CSV: str = "snoozes.csv"):
 
         self.SNOOZE_CSV = SNOOZE_CSV
-        self.overrides = {}
+        # nested {med_id: {scheduled_iso: new_dt}} so the week builder can
+        # grab one med's overrides once instead of hashing a tuple per dose
+        self.overrides = defaultdict(dict)
 
         # if needed, load existing snoozes from CSV to dict otherwise create new csv file
         if not os.path.exists(SNOOZE_CSV):
             with open(SNOOZE_CSV, "w") as f:
                 f.write("med_id,scheduled_iso,new_dt_iso\n")
         else:
-            df = pandas.read_csv(SNOOZE_CSV)
-            for _, row in df.iterrows(): # make dictionary of overrides (maybe switch to using a dataframe?)
-                self.overrides[(row["med_id"], row["scheduled_iso"])] = datetime.fromisoformat(row["new_dt_iso"])
+            # stdlib csv streams straight into the dict — no pandas import
+            # (~300ms) or DataFrame/iterrows overhead for a 3-column file
+            with open(SNOOZE_CSV, newline="") as f:
+                reader = csv.reader(f)
+                next(reader, None)  # header
+                for med_id, scheduled_iso, new_dt_iso in reader:
+                    self.overrides[med_id][scheduled_iso] = datetime.fromisoformat(new_dt_iso)
 
     def save_snoozes(self):
-        # save current overrides dict to CSV
+        # full rewrite of the CSV; only needed by compact() now — adds go
+        # through the O(1) append below instead
         with open(self.SNOOZE_CSV, "w") as f:
             f.write("med_id,scheduled_iso,new_dt_iso\n")
-            for (med_id, scheduled_iso), new_dt in self.overrides.items():
-                f.write(f"{med_id},{scheduled_iso},{new_dt.isoformat()}\n")
-    
-    def add_snooze(self, med_id: str, scheduled_iso: str, new_dt: datetime):
-        self.overrides[(med_id, scheduled_iso)] = new_dt
+            for med_id, per_med in self.overrides.items():
+                for scheduled_iso, new_dt in per_med.items():
+                    f.write(f"{med_id},{scheduled_iso},{new_dt.isoformat()}\n")
+
+    def compact(self):
+        # drop superseded rows by rewriting once; call on startup or after
+        # enough appends have piled up
         self.save_snoozes()
-    
+
+    def add_snooze(self, med_id: str, scheduled_iso: str, new_dt: datetime):
+        self.overrides[med_id][scheduled_iso] = new_dt
+        # append one line instead of rewriting the whole file; on load,
+        # later rows for the same key override earlier ones
+        with open(self.SNOOZE_CSV, "a") as f:
+            f.write(f"{med_id},{scheduled_iso},{new_dt.isoformat()}\n")
+
+
     def get_override(self, med_id: str, scheduled_iso: str) -> datetime | None:
-        return self.overrides.get((med_id, scheduled_iso))
+        return self.overrides.get(med_id, {}).get(scheduled_iso)
+
+    def overrides_for(self, med_id: str) -> dict:
+        # fetch once per med in build_today_schedule, then .get per dose
+        return self.overrides.get(med_id, {})
 
 
 # Create global instance (still global but encapsulated)
@@ -35,5 +56,6 @@ snooze_manager = SnoozeManager()
 
 def build_today_schedule() -> list[dict]:
     # ...existing code...
-    override = snooze_manager.get_override(r["med_id"], scheduled_iso)
+    med_overrides = snooze_manager.overrides_for(r["med_id"])  # once per med
+    override = med_overrides.get(scheduled_iso)
     # ...rest of function...
\ No newline at end of file